@@ -7,7 +7,11 @@ from src.core.events import events
 from enum import Enum
 
 
-@dataclass(frozen=True)
+# Identifier pattern shared by ID value objects.
+HEX_ID_PATTERN = r"^[0-9a-f]{32}$"
+
+
+@dataclass(frozen=True, slots=True)
 class BaseValueObject:
     # def __composite_values__(self) -> tuple[Any, ...]:
     #     return tuple(getattr(self, field.name) for field in fields(self))
@@ -20,31 +24,31 @@ class BaseValueObject:
     ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserID(BaseValueObject):
     """Value object representing a user ID from external user service."""
     value: Annotated[
         str,
-        Field(pattern=r"^[0-9a-f]{32}$")
+        Field(pattern=HEX_ID_PATTERN)
     ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NotificationEmail(BaseValueObject):
     """Value object for notification email addresses."""
     value: EmailStr
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NotificationID(BaseValueObject):
     """Value object for notification request identifiers."""
     value: Annotated[
         str,
-        Field(pattern=r"^[0-9a-f]{32}$")
+        Field(pattern=HEX_ID_PATTERN)
     ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PreferenceSettings(BaseValueObject):
     """Value object for notification preference settings."""
     email_verification: bool = True
@@ -0,0 +1,10 @@
+# tests/_idpool.py
+import random
+
+# Seeded generator so test identifiers are deterministic and cheap to produce
+_rng = random.Random(0)
+
+
+def fresh_id() -> str:
+    """Return a new 32-character hex identifier for test fixtures"""
+    return f"{_rng.getrandbits(128):032x}"
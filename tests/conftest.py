@@ -1,8 +1,8 @@
 # tests/conftest.py
 import pytest
+from unittest.mock import create_autospec
 from uuid import uuid4
 from src.domain.model import NotificationPreferences, NotificationRequest, NotificationType
-from src.bootstrap import bootstrap
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, clear_mappers
 from src.adapters.database.orm import init_orm_mappers, metadata
@@ -13,12 +13,13 @@ from src.adapters.database.repository import (
     AbstractNotificationRequestRepository
 )
 from src.service_layer.unit_of_work import AbstractUnitOfWork, SqlAlchemyUnitOfWork
+from src.adapters.email_provider import AbstractEmailProvider
 
 
 class FakeNotificationPreferencesRepository(AbstractNotificationPreferencesRepository):
     def __init__(self, preferences=None):
         super().__init__()
-        self._preferences = preferences or {}
+        self._preferences = dict(preferences or {})
 
     def _add(self, preferences):
         self._preferences[preferences.userid.value] = preferences
@@ -26,11 +27,15 @@ class FakeNotificationPreferencesRepository(AbstractNotificationPreferencesRepos
     def _get(self, userid):
         return self._preferences.get(userid)
 
+    def clear(self):
+        self._preferences.clear()
+        self.seen.clear()
+
 
 class FakeNotificationRequestRepository(AbstractNotificationRequestRepository):
     def __init__(self, requests=None):
         super().__init__()
-        self._requests = requests or {}
+        self._requests = dict(requests or {})
 
     def _add(self, request):
         self._requests[request.notification_id.value] = request
@@ -38,6 +43,18 @@ class FakeNotificationRequestRepository(AbstractNotificationRequestRepository):
     def _get(self, notification_id):
         return self._requests.get(notification_id)
 
+    def all_ids(self):
+        return self._requests.keys()
+
+    def add_many(self, requests):
+        requests = list(requests)
+        self._requests.update({r.notification_id.value: r for r in requests})
+        self.seen.update(requests)
+
+    def clear(self):
+        self._requests.clear()
+        self.seen.clear()
+
     def get_failed_notifications(self, max_retry_count=3):
         return [r for r in self._requests.values()
                 if hasattr(r.status, 'value') and r.status.value == 'failed' and r.retry_count < max_retry_count]
@@ -55,6 +72,12 @@ class FakeUnitOfWork(AbstractUnitOfWork):
     def rollback(self):
         pass
 
+    def reset(self):
+        """Discard stored aggregates so the unit of work can be reused"""
+        self.notification_preferences.clear()
+        self.notification_requests.clear()
+        self.committed = False
+
 
 @pytest.fixture(scope="function")
 def sqlite_engine():
@@ -90,6 +113,7 @@ def sqlalchemy_repository(sqlite_session_factory):
             session.close()
         except:
             pass
+        clear_mappers()
 
 
 @pytest.fixture(scope="function")
@@ -104,12 +128,25 @@ def sqlalchemy_unit_of_work(sqlite_session_factory):
         yield FakeUnitOfWork()
 
 
-@pytest.fixture(scope="function")
-def fake_unit_of_work():
-    """Create fake unit of work for isolated testing"""
+@pytest.fixture(scope="class")
+def _shared_fake_unit_of_work():
+    """Create fake unit of work shared by the tests of a class"""
     return FakeUnitOfWork()
 
 
+@pytest.fixture(scope="function")
+def fake_unit_of_work(_shared_fake_unit_of_work):
+    """Provide the shared fake unit of work, reset after each test"""
+    yield _shared_fake_unit_of_work
+    _shared_fake_unit_of_work.reset()
+
+
+@pytest.fixture(scope="function")
+def email_provider():
+    """Create autospec email provider mock"""
+    return create_autospec(AbstractEmailProvider, instance=True)
+
+
 @pytest.fixture(scope="function")
 def notification_preferences():
     """Create test notification preferences"""
@@ -1,15 +1,19 @@
 # tests/integration/test_notification_flow.py
 import pytest
-from uuid import uuid4
+from tests._idpool import fresh_id
 from src.domain.model import NotificationPreferences, NotificationRequest, NotificationType
 
 
+# Enum values resolved once for the subject f-strings below
+NT_VALUE = {nt: nt.value for nt in NotificationType}
+
+
 class TestNotificationDomainFlow:
     """Integration tests for notification domain logic flow"""
 
     def test_complete_notification_preferences_flow(self, fake_unit_of_work):
         """Test complete flow: create preferences -> retrieve -> modify"""
-        userid = uuid4().hex
+        userid = fresh_id()
         email = "test@example.com"
 
         # 1. Create notification preferences
@@ -39,8 +43,8 @@ class TestNotificationDomainFlow:
 
     def test_notification_request_lifecycle(self, fake_unit_of_work):
         """Test notification request from creation to completion"""
-        notification_id = uuid4().hex
-        userid = uuid4().hex
+        notification_id = fresh_id()
+        userid = fresh_id()
 
         # 1. Create notification request
         notification_request = NotificationRequest.create(
@@ -69,12 +73,12 @@ class TestNotificationDomainFlow:
 
     def test_notification_failure_and_retry_flow(self, fake_unit_of_work):
         """Test notification failure and retry workflow"""
-        notification_id = uuid4().hex
+        notification_id = fresh_id()
 
         # 1. Create and save notification request
         notification_request = NotificationRequest.create(
             notification_id=notification_id,
-            userid=uuid4().hex,
+            userid=fresh_id(),
             notification_type=NotificationType.EMAIL_VERIFICATION,
             recipient_email="test@example.com",
             subject="Email Verification",
@@ -101,9 +105,14 @@ class TestNotificationDomainFlow:
         # This matches the domain logic: you can only retry FAILED notifications
         assert notification_request.can_retry(max_retries=3) is False
 
-    def test_preferences_and_notification_interaction(self, fake_unit_of_work):
+    @pytest.mark.parametrize("notification_type, should_be_enabled", [
+        (NotificationType.EMAIL_VERIFICATION, True),
+        (NotificationType.SECURITY_ALERT, False),
+        (NotificationType.PASSWORD_RESET, True),
+    ])
+    def test_preferences_and_notification_interaction(self, fake_unit_of_work, notification_type, should_be_enabled):
         """Test interaction between preferences and notifications"""
-        userid = uuid4().hex
+        userid = fresh_id()
         email = "user@example.com"
 
         # 1. Set up user preferences
@@ -121,29 +130,21 @@ class TestNotificationDomainFlow:
         fake_unit_of_work.notification_preferences.add(preferences)
         fake_unit_of_work.commit()
 
-        # 2. Test different notification types against preferences
-        test_cases = [
-            (NotificationType.EMAIL_VERIFICATION, True),
-            (NotificationType.SECURITY_ALERT, False),
-            (NotificationType.PASSWORD_RESET, True),
-        ]
-
-        for notification_type, should_be_enabled in test_cases:
-            enabled = preferences.is_notification_enabled(notification_type)
-            assert enabled == should_be_enabled, f"{notification_type} should be {should_be_enabled}"
-
-            # Create notification request
-            notification_request = NotificationRequest.create(
-                notification_id=uuid4().hex,
-                userid=userid,
-                notification_type=notification_type,
-                recipient_email=email,
-                subject=f"Test {notification_type.value}",
-                content="Test content"
-            )
+        # 2. Test the notification type against preferences
+        enabled = preferences.is_notification_enabled(notification_type)
+        assert enabled == should_be_enabled, f"{notification_type} should be {should_be_enabled}"
 
-            fake_unit_of_work.notification_requests.add(notification_request)
+        # Create notification request
+        notification_request = NotificationRequest.create(
+            notification_id=fresh_id(),
+            userid=userid,
+            notification_type=notification_type,
+            recipient_email=email,
+            subject=f"Test {NT_VALUE[notification_type]}",
+            content="Test content"
+        )
 
+        fake_unit_of_work.notification_requests.add(notification_request)
         fake_unit_of_work.commit()
 
 
@@ -152,63 +153,61 @@ class TestNotificationBulkOperations:
 
     def test_bulk_notification_creation(self, fake_unit_of_work):
         """Test creating multiple notifications efficiently"""
-        userid = uuid4().hex
+        userid = fresh_id()
         notification_requests = []
 
         # Create multiple notifications
         for i in range(10):
             notification_request = NotificationRequest.create(
-                notification_id=uuid4().hex,
+                notification_id=fresh_id(),
                 userid=userid,
-                notification_type=NotificationType.WELCOME,  # Fixed: use existing type
+                notification_type=NotificationType.WELCOME,
                 recipient_email=f"user{i}@example.com",
                 subject=f"Welcome Email {i}",
                 content=f"Welcome content for user {i}"
             )
             notification_requests.append(notification_request)
-            fake_unit_of_work.notification_requests.add(notification_request)
 
+        fake_unit_of_work.notification_requests.add_many(notification_requests)
         fake_unit_of_work.commit()
 
         # Verify all were created
-        for notification_request in notification_requests:
-            retrieved = fake_unit_of_work.notification_requests.get(
-                notification_request.notification_id.value
-            )
-            assert retrieved is not None
-            assert retrieved.notification_type == NotificationType.WELCOME
+        repository = fake_unit_of_work.notification_requests
+        stored_ids = set(repository.all_ids())
+        assert stored_ids == {n.notification_id.value for n in notification_requests}
+        assert {repository.get(i).notification_type for i in stored_ids} == {NotificationType.WELCOME}
 
     def test_failed_notifications_bulk_query(self, fake_unit_of_work):
         """Test querying multiple failed notifications"""
-        failed_count = 0
         total_count = 15
+        failure_indices = frozenset(range(0, total_count, 3))  # Every 3rd notification fails
+        notification_requests = []
 
-        # Create mix of successful and failed notifications
+        # Create notifications
         for i in range(total_count):
             notification_request = NotificationRequest.create(
-                notification_id=uuid4().hex,
-                userid=uuid4().hex,
+                notification_id=fresh_id(),
+                userid=fresh_id(),
                 notification_type=NotificationType.SECURITY_ALERT,
                 recipient_email=f"user{i}@example.com",
                 subject=f"Alert {i}",
                 content="Security alert"
             )
+            notification_requests.append(notification_request)
 
-            # Mark some as failed
-            if i % 3 == 0:  # Every 3rd notification fails
-                notification_request.mark_as_failed("Delivery failed")
-                failed_count += 1
-            else:
-                notification_request.mark_as_sent()
-
-            fake_unit_of_work.notification_requests.add(notification_request)
+        # Mark a mix of them as failed and sent
+        for i in failure_indices:
+            notification_requests[i].mark_as_failed("Delivery failed")
+        for i in frozenset(range(total_count)) - failure_indices:
+            notification_requests[i].mark_as_sent()
+        failed_count = len(failure_indices)
 
+        fake_unit_of_work.notification_requests.add_many(notification_requests)
         fake_unit_of_work.commit()
 
         # Query failed notifications
         failed_notifications = fake_unit_of_work.notification_requests.get_failed_notifications()
 
         assert len(failed_notifications) == failed_count
-        for notification in failed_notifications:
-            assert notification.status.value == 'failed'
-            assert notification.retry_count < 3
+        assert {n.status.value for n in failed_notifications} == {'failed'}
+        assert all(n.retry_count < 3 for n in failed_notifications)
@@ -1,4 +1,4 @@
-from uuid import uuid4
+from tests._idpool import fresh_id
 from src.domain.model import NotificationPreferences, NotificationRequest, NotificationType
 
 
@@ -7,7 +7,7 @@ class TestNotificationPreferencesRepository:
 
     def test_notification_preferences_repository_add_and_get(self, fake_unit_of_work):
         """Test adding and retrieving notification preferences using fake repository."""
-        userid = uuid4().hex
+        userid = fresh_id()
         preferences = NotificationPreferences.create(
             userid=userid,
             notification_email="test@example.com"
@@ -22,12 +22,12 @@ class TestNotificationPreferencesRepository:
 
     def test_notification_preferences_repository_get_nonexistent(self, fake_unit_of_work):
         """Test retrieving non-existent notification preferences returns None."""
-        result = fake_unit_of_work.notification_preferences.get(uuid4().hex)
+        result = fake_unit_of_work.notification_preferences.get(fresh_id())
         assert result is None
 
     def test_notification_preferences_with_custom_settings(self, fake_unit_of_work):
         """Test creating preferences with custom notification settings"""
-        userid = uuid4().hex
+        userid = fresh_id()
         preferences = NotificationPreferences.create(
             userid=userid,
             notification_email="custom@example.com",
@@ -47,13 +47,35 @@ class TestNotificationPreferencesRepository:
         assert retrieved.preferences.value['marketing'] is True
 
 
+class TestSqlAlchemyNotificationPreferencesRepository:
+    """Integration tests for notification preferences persisted through SQLAlchemy"""
+
+    def test_preferences_enabled_check_after_orm_load(self, sqlalchemy_repository):
+        """Test that preferences loaded from the database answer notification type checks"""
+        userid = fresh_id()
+        preferences = NotificationPreferences.create(
+            userid=userid,
+            notification_email="orm@example.com",
+            preferences={'welcome': False}
+        )
+
+        sqlalchemy_repository.add(preferences)
+        sqlalchemy_repository.session.commit()
+        sqlalchemy_repository.session.expunge_all()
+        retrieved = sqlalchemy_repository.get(userid)
+
+        assert retrieved is not preferences
+        assert retrieved.is_notification_enabled(NotificationType.WELCOME) is False
+        assert retrieved.is_notification_enabled(NotificationType.PASSWORD_RESET) is True
+
+
 class TestNotificationRequestRepository:
     """Integration tests for notification request repository"""
 
     def test_notification_request_add_and_get(self, fake_unit_of_work):
         """Test adding and retrieving notification requests"""
-        notification_id = uuid4().hex
-        userid = uuid4().hex
+        notification_id = fresh_id()
+        userid = fresh_id()
 
         notification_request = NotificationRequest.create(
             notification_id=notification_id,
@@ -74,11 +96,11 @@ class TestNotificationRequestRepository:
 
     def test_notification_status_transitions(self, fake_unit_of_work):
         """Test notification status transitions"""
-        notification_id = uuid4().hex
+        notification_id = fresh_id()
 
         notification_request = NotificationRequest.create(
             notification_id=notification_id,
-            userid=uuid4().hex,
+            userid=fresh_id(),
             notification_type=NotificationType.PASSWORD_RESET,
             recipient_email="test@example.com",
             subject="Password Reset",
@@ -100,11 +122,11 @@ class TestNotificationRequestRepository:
 
     def test_notification_failure_and_retry(self, fake_unit_of_work):
         """Test notification failure and retry mechanism"""
-        notification_id = uuid4().hex
+        notification_id = fresh_id()
 
         notification_request = NotificationRequest.create(
             notification_id=notification_id,
-            userid=uuid4().hex,
+            userid=fresh_id(),
             notification_type=NotificationType.EMAIL_VERIFICATION,
             recipient_email="test@example.com",
             subject="Email Verification",
@@ -134,11 +156,12 @@ class TestNotificationRequestRepository:
         """Test querying failed notifications for retry"""
         # Create multiple notification requests with different statuses
         failed_notifications = []
+        notification_requests = []
 
         for i in range(5):
             notification_request = NotificationRequest.create(
-                notification_id=uuid4().hex,
-                userid=uuid4().hex,
+                notification_id=fresh_id(),
+                userid=fresh_id(),
                 notification_type=NotificationType.SECURITY_ALERT,
                 recipient_email=f"user{i}@example.com",
                 subject=f"Alert {i}",
@@ -151,15 +174,16 @@ class TestNotificationRequestRepository:
             else:  # Mark last 2 as sent
                 notification_request.mark_as_sent()
 
-            fake_unit_of_work.notification_requests.add(notification_request)
+            notification_requests.append(notification_request)
+
+        fake_unit_of_work.notification_requests.add_many(notification_requests)
 
         # Query failed notifications
         retrieved_failed = fake_unit_of_work.notification_requests.get_failed_notifications()
 
         assert len(retrieved_failed) == 3
-        for notification in retrieved_failed:
-            assert notification.status.value == 'failed'
-            assert notification.retry_count < 3
+        assert {n.status.value for n in retrieved_failed} == {'failed'}
+        assert all(n.retry_count < 3 for n in retrieved_failed)
 
 
 class TestRepositoryTransactions:
@@ -167,7 +191,7 @@ class TestRepositoryTransactions:
 
     def test_unit_of_work_commit_behavior(self, fake_unit_of_work):
         """Test unit of work commit behavior"""
-        userid = uuid4().hex
+        userid = fresh_id()
 
         preferences = NotificationPreferences.create(
             userid=userid,
@@ -190,7 +214,7 @@ class TestRepositoryTransactions:
 
     def test_rollback_behavior(self, fake_unit_of_work):
         """Test rollback behavior"""
-        userid = uuid4().hex
+        userid = fresh_id()
 
         preferences = NotificationPreferences.create(
             userid=userid,
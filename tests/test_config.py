@@ -2,7 +2,6 @@
 """Test configuration and utilities for notification service tests"""
 
 import pytest
-from unittest.mock import Mock, patch
 
 
 class TestEmailProvider:
@@ -1,7 +1,9 @@
+import copy
+import pickle
 import pytest
 from uuid import uuid4
-from unittest.mock import Mock, patch
 from src.domain.model import NotificationPreferences, NotificationRequest, NotificationType
+from src.service_layer import handlers
 from src.domain.commands import (
     UpdateNotificationPreferencesCommand,
     SendNotificationCommand,
@@ -80,6 +82,39 @@ class TestNotificationDomainModel:
         assert preferences.is_notification_enabled(NotificationType.EMAIL_VERIFICATION) is False
         assert preferences.is_notification_enabled(NotificationType.SECURITY_ALERT) is True
 
+    def test_notification_preferences_enabled_check_after_copy(self):
+        """Test that copied preferences still answer notification type checks"""
+        preferences = NotificationPreferences.create(
+            userid=uuid4().hex,
+            notification_email="copy@example.com",
+            preferences={'welcome': False}
+        )
+
+        copied = copy.copy(preferences)
+
+        assert copied.is_notification_enabled(NotificationType.WELCOME) is False
+        assert copied.is_notification_enabled(NotificationType.PASSWORD_RESET) is True
+
+    def test_preference_settings_enabled_check_after_copy_and_pickle(self):
+        """Test that copied and unpickled settings keep answering notification type checks"""
+        preferences = NotificationPreferences.create(
+            userid=uuid4().hex,
+            notification_email="copy@example.com",
+            preferences={'welcome': False}
+        )
+
+        for settings in (
+            copy.copy(preferences.preferences),
+            copy.deepcopy(preferences.preferences),
+            pickle.loads(pickle.dumps(preferences.preferences))
+        ):
+            preferences.preferences = settings
+            assert preferences.is_notification_enabled(NotificationType.WELCOME) is False
+            assert preferences.is_notification_enabled(NotificationType.SECURITY_ALERT) is True
+
+        deep_copied = copy.deepcopy(preferences)
+        assert deep_copied.is_notification_enabled(NotificationType.WELCOME) is False
+
 
 class TestNotificationRequest:
     """Unit tests for notification request model"""
@@ -250,6 +285,34 @@ class TestNotificationCommands:
         assert command.notification_id == notification_id
 
 
+class TestNotificationHandlers:
+    """Unit tests for notification command handlers"""
+
+    @pytest.mark.asyncio
+    async def test_send_notification_handler_sends_email(self, fake_unit_of_work, email_provider):
+        """Test that a successful send marks the request as sent and commits"""
+        email_provider.send_email.return_value = True
+        command = SendNotificationCommand(
+            userid=uuid4().hex,
+            notification_type=NotificationType.WELCOME.value,
+            recipient_email="test@example.com",
+            subject="Welcome",
+            content="Welcome content"
+        )
+
+        await handlers.send_notification_handler(command, fake_unit_of_work, email_provider)
+
+        email_provider.send_email.assert_awaited_once_with(
+            to_email="test@example.com",
+            subject="Welcome",
+            content="Welcome content",
+            template_vars=None
+        )
+        [request] = fake_unit_of_work.notification_requests.seen
+        assert request.status.value == 'sent'
+        assert fake_unit_of_work.committed is True
+
+
 class TestNotificationBusinessLogic:
     """Unit tests for notification business logic"""
 